@@ -2,6 +2,9 @@
 
 import re
 import os
+import bisect
+import asyncio
+from functools import partial
 from pathlib import Path
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
@@ -12,9 +15,15 @@ from textual.widgets import Header, Footer, TextArea, Static, Input, ListView, L
 from textual.binding import Binding
 from textual.screen import Screen, ModalScreen
 from textual.message import Message
+from textual.worker import get_current_worker
 from rich.console import Console
 from rich.markdown import Markdown
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 @dataclass
 class State:
@@ -49,6 +58,8 @@ class ConfirmModal(ModalScreen):
 
 
 class FileBrowser(ModalScreen):
+    _dir_cache: dict = {}
+
     def __init__(self, title: str, currentDir: Optional[Path] = None):
         super().__init__()
         self.title = title
@@ -72,22 +83,44 @@ class FileBrowser(ModalScreen):
     def updateFileList(self) -> None:
         self.fileList.clear()
         self.pathMap.clear()
-        
+
+        listItems: List[ListItem] = []
         if self.currentDir.parent != self.currentDir:
-            self.fileList.append(ListItem(Label(".."), id="parent"))
-        
+            listItems.append(ListItem(Label(".."), id="parent"))
+
         try:
-            items = sorted(self.currentDir.iterdir())
-            for idx, item in enumerate(items):
+            items, dirFlags = self._scanDir()
+            for idx, (item, isDir) in enumerate(zip(items, dirFlags)):
                 itemId = f"item_{idx}"
                 self.pathMap[itemId] = item
-                
-                if item.is_dir():
-                    self.fileList.append(ListItem(Label(f"📁 {item.name}"), id=itemId))
-                elif item.suffix.lower() in ['.md', '.txt', '.markdown']:
-                    self.fileList.append(ListItem(Label(f"📄 {item.name}"), id=itemId))
+                icon = "📁" if isDir else "📄"
+                listItems.append(ListItem(Label(f"{icon} {item.name}"), id=itemId))
         except PermissionError:
-            self.fileList.append(ListItem(Label("Permission denied"), id="error"))
+            listItems.append(ListItem(Label("Permission denied"), id="error"))
+
+        self.fileList.extend(listItems)
+
+    def _scanDir(self) -> Tuple[List[Path], List[bool]]:
+        mtime = self.currentDir.stat().st_mtime
+        cached = FileBrowser._dir_cache.get(self.currentDir)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        with os.scandir(self.currentDir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+
+        items: List[Path] = []
+        dirFlags: List[bool] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                items.append(Path(entry.path))
+                dirFlags.append(True)
+            elif '.' in entry.name and entry.name.rsplit('.', 1)[-1].lower() in {'md', 'txt', 'markdown'}:
+                items.append(Path(entry.path))
+                dirFlags.append(False)
+
+        FileBrowser._dir_cache[self.currentDir] = (mtime, items, dirFlags)
+        return items, dirFlags
     
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.item.id == "parent":
@@ -189,176 +222,191 @@ class CustomTextArea(TextArea):
         Binding("f6", "h6", "H6", show=False, priority=True),
     ]
 
+    _APP_ACTIONS = (
+        'action_bold', 'action_italic', 'action_link', 'action_code_block',
+        'action_inline_code', 'action_list',
+        'action_h1', 'action_h2', 'action_h3',
+        'action_h4', 'action_h5', 'action_h6',
+    )
+
+    def on_mount(self) -> None:
+        self._app_actions = {
+            name: getattr(self.app, name, None) for name in self._APP_ACTIONS
+        }
+
+    def _run_app_action(self, name: str) -> None:
+        fn = self._app_actions[name]
+        if fn is not None:
+            fn()
+
     def action_bold(self) -> None:
-        getattr(self.app, 'action_bold', lambda: None)()
-    
+        self._run_app_action('action_bold')
+
     def action_italic(self) -> None:
-        getattr(self.app, 'action_italic', lambda: None)()
-    
+        self._run_app_action('action_italic')
+
     def action_link(self) -> None:
-        getattr(self.app, 'action_link', lambda: None)()
-    
+        self._run_app_action('action_link')
+
     def action_code_block(self) -> None:
-        getattr(self.app, 'action_code_block', lambda: None)()
-    
+        self._run_app_action('action_code_block')
+
     def action_inline_code(self) -> None:
-        getattr(self.app, 'action_inline_code', lambda: None)()
-    
+        self._run_app_action('action_inline_code')
+
     def action_list(self) -> None:
-        getattr(self.app, 'action_list', lambda: None)()
-    
+        self._run_app_action('action_list')
+
     def action_h1(self) -> None:
-        getattr(self.app, 'action_h1', lambda: None)()
-    
+        self._run_app_action('action_h1')
+
     def action_h2(self) -> None:
-        getattr(self.app, 'action_h2', lambda: None)()
-    
+        self._run_app_action('action_h2')
+
     def action_h3(self) -> None:
-        getattr(self.app, 'action_h3', lambda: None)()
-    
+        self._run_app_action('action_h3')
+
     def action_h4(self) -> None:
-        getattr(self.app, 'action_h4', lambda: None)()
-    
+        self._run_app_action('action_h4')
+
     def action_h5(self) -> None:
-        getattr(self.app, 'action_h5', lambda: None)()
-    
+        self._run_app_action('action_h5')
+
     def action_h6(self) -> None:
-        getattr(self.app, 'action_h6', lambda: None)()
+        self._run_app_action('action_h6')
 
 
-class Format:
-    @staticmethod
-    def bold(text: str, pos: int) -> Tuple[str, int]:
-        return Format._wrap(text, pos, "**")
-    
-    @staticmethod
-    def italic(text: str, pos: int) -> Tuple[str, int]:
-        return Format._wrap(text, pos, "*")
-    
-    @staticmethod
-    def inlineCode(text: str, pos: int) -> Tuple[str, int]:
-        return Format._wrap(text, pos, "`")
-    
-    @staticmethod
-    def _wrap(text: str, pos: int, wrapper: str) -> Tuple[str, int]:
-        wlen = len(wrapper)
-        
+_HEADING_RE = re.compile(r'^(#{1,6})\s*')
+
+
+def bold(text: str, pos: int) -> Tuple[str, int]:
+    return _wrap(text, pos, "**")
+
+
+def italic(text: str, pos: int) -> Tuple[str, int]:
+    return _wrap(text, pos, "*")
+
+
+def inlineCode(text: str, pos: int) -> Tuple[str, int]:
+    return _wrap(text, pos, "`")
+
+
+_FULL_SCAN_THRESHOLD = 4096
+
+
+def _wrap(text: str, pos: int, wrapper: str) -> Tuple[str, int]:
+    wlen = len(wrapper)
+
+    if len(text) > _FULL_SCAN_THRESHOLD:
+        # The 40-char window misses pairs that span paragraphs in big
+        # documents; str.find is a C-level scan, so searching the whole
+        # buffer stays cheap even at hundreds of KB.
+        left = 0
+        search_text = text
+        search_pos = pos
+    else:
         left = max(0, pos - 20)
         right = min(len(text), pos + 20)
         search_text = text[left:right]
         search_pos = pos - left
-        
-        start_pattern = re.escape(wrapper)
-        matches = list(re.finditer(start_pattern, search_text))
-        
-        for i in range(0, len(matches) - 1, 2):
-            if i + 1 < len(matches):
-                start_match = matches[i]
-                end_match = matches[i + 1]
-                
-                if start_match.end() <= search_pos <= end_match.start():
-                    actual_start = left + start_match.start()
-                    actual_end = left + end_match.end()
-                    content = text[actual_start + wlen:actual_end - wlen]
-                    new_text = text[:actual_start] + content + text[actual_end:]
-                    new_pos = actual_start + len(content)
-                    return new_text, new_pos
-        
-        new_text = text[:pos] + wrapper + wrapper + text[pos:]
-        new_pos = pos + wlen
-        return new_text, new_pos
-    
-    @staticmethod
-    def heading(text: str, pos: int, level: int) -> Tuple[str, int]:
-        if not 1 <= level <= 6:
-            return text, pos
-        
-        lines = text.split('\n')
-        current_pos = 0
-        target_line = 0
-        
-        for i, line in enumerate(lines):
-            if current_pos + len(line) >= pos:
-                target_line = i
-                break
-            current_pos += len(line) + 1
-        
-        line = lines[target_line]
-        heading_match = re.match(r'^(#{1,6})\s*', line)
-        
-        if heading_match:
-            new_line = '#' * level + ' ' + line[heading_match.end():]
-        else:
-            new_line = '#' * level + ' ' + line
-        
-        old_len = len(lines[target_line])
-        lines[target_line] = new_line
-        new_text = '\n'.join(lines)
-        
-        pos_in_line = pos - current_pos
-        new_pos = current_pos + min(pos_in_line + (len(new_line) - old_len), len(new_line))
-        
-        return new_text, new_pos
-    
-    @staticmethod
-    def link(text: str, pos: int) -> Tuple[str, int]:
-        link_text = "[text](url)"
-        new_text = text[:pos] + link_text + text[pos:]
-        new_pos = pos + 1
-        return new_text, new_pos
-    
-    @staticmethod
-    def codeBlock(text: str, pos: int) -> Tuple[str, int]:
-        lines = text.split('\n')
-        current_pos = 0
-        
-        for i, line in enumerate(lines):
-            if current_pos + len(line) >= pos:
-                line_start = current_pos
-                break
-            current_pos += len(line) + 1
-        else:
-            line_start = len(text)
-        
-        if pos > 0 and text[pos - 1] != '\n':
-            block = "\n```\n\n```\n"
-            new_pos = pos + 5
-        else:
-            block = "```\n\n```\n"
-            new_pos = pos + 4
-        
-        new_text = text[:pos] + block + text[pos:]
-        return new_text, new_pos
-    
-    @staticmethod
-    def listItem(text: str, pos: int) -> Tuple[str, int]:
-        lines = text.split('\n')
-        current_pos = 0
-        target_line = 0
-        
-        for i, line in enumerate(lines):
-            if current_pos + len(line) >= pos:
-                target_line = i
-                break
-            current_pos += len(line) + 1
-        
-        line = lines[target_line]
-        stripped = line.lstrip()
-        
-        if stripped.startswith('- '):
-            indent = line[:len(line) - len(stripped)]
-            new_line = indent + stripped[2:]
-            pos_change = -2
-        else:
-            indent = line[:len(line) - len(stripped)]
-            new_line = indent + '- ' + stripped
-            pos_change = 2
-        
-        lines[target_line] = new_line
-        new_text = '\n'.join(lines)
-        new_pos = pos + pos_change
-        
-        return new_text, new_pos
+
+    positions = []
+    i = 0
+    while (j := search_text.find(wrapper, i)) != -1:
+        positions.append(j)
+        i = j + wlen
+
+    for i in range(0, len(positions) - 1, 2):
+        start = positions[i]
+        end = positions[i + 1]
+
+        if start + wlen <= search_pos <= end:
+            actual_start = left + start
+            actual_end = left + end + wlen
+            content = text[actual_start + wlen:actual_end - wlen]
+            new_text = text[:actual_start] + content + text[actual_end:]
+            new_pos = actual_start + len(content)
+            return new_text, new_pos
+    
+    new_text = text[:pos] + wrapper + wrapper + text[pos:]
+    new_pos = pos + wlen
+    return new_text, new_pos
+
+
+def heading(text: str, pos: int, level: int) -> Tuple[str, int]:
+    if not 1 <= level <= 6:
+        return text, pos
+
+    line_start = text.rfind('\n', 0, pos) + 1
+    line_end = text.find('\n', pos)
+    if line_end == -1:
+        line_end = len(text)
+
+    line = text[line_start:line_end]
+    heading_match = _HEADING_RE.match(line)
+
+    if heading_match:
+        new_line = '#' * level + ' ' + line[heading_match.end():]
+    else:
+        new_line = '#' * level + ' ' + line
+
+    new_text = text[:line_start] + new_line + text[line_end:]
+
+    pos_in_line = pos - line_start
+    new_pos = line_start + min(pos_in_line + (len(new_line) - len(line)), len(new_line))
+
+    return new_text, new_pos
+
+
+def link(text: str, pos: int) -> Tuple[str, int]:
+    link_text = "[text](url)"
+    new_text = text[:pos] + link_text + text[pos:]
+    new_pos = pos + 1
+    return new_text, new_pos
+
+
+def codeBlock(text: str, pos: int) -> Tuple[str, int]:
+    if pos > 0 and text[pos - 1] != '\n':
+        block = "\n```\n\n```\n"
+        new_pos = pos + 5
+    else:
+        block = "```\n\n```\n"
+        new_pos = pos + 4
+    
+    new_text = text[:pos] + block + text[pos:]
+    return new_text, new_pos
+
+
+def listItem(text: str, pos: int) -> Tuple[str, int]:
+    line_start = text.rfind('\n', 0, pos) + 1
+    line_end = text.find('\n', pos)
+    if line_end == -1:
+        line_end = len(text)
+
+    line = text[line_start:line_end]
+    stripped = line.lstrip()
+    indent = line[:len(line) - len(stripped)]
+
+    if stripped.startswith('- '):
+        new_line = indent + stripped[2:]
+        pos_change = -2
+    else:
+        new_line = indent + '- ' + stripped
+        pos_change = 2
+
+    new_text = text[:line_start] + new_line + text[line_end:]
+    new_pos = pos + pos_change
+
+    return new_text, new_pos
+
+# A blank line only ends a block when the next non-blank line starts a
+# fresh top-level one; indentation or a list marker means continuation
+# (loose lists, indented code, nested items).
+_BLOCK_CONTINUATION_RE = re.compile(r'\s|[-*+]\s|\d+[.)]\s')
+
+# Reference-link definitions resolve against the whole document, so
+# paragraph-level parsing would render their uses literally.
+_LINK_DEF_RE = re.compile(r'^ {0,3}\[[^\]]+\]:', re.MULTILINE)
 
 
 class Preview(Static):
@@ -366,20 +414,98 @@ class Preview(Static):
         super().__init__(**kwargs)
         self.content = ""
         self.can_focus = True
-    
-    def update_content(self, text: str) -> None:
+        self._para_cache: dict = {}
+        self._last_hash: Optional[int] = None
+
+    def render_content(self, text: str):
+        """Build (renderable, paragraph cache) for *text*, or None when
+        *text* matches the last applied render.
+
+        Paragraphs are parsed individually (reusing cached token streams)
+        and the streams are stitched into a single Markdown, so the output
+        is identical to a whole-document parse while only edited
+        paragraphs pay for parsing.
+
+        Mutates no state, so it is safe to call from a worker thread;
+        commit the result on the UI thread with apply_render. The cache
+        is None when the build failed.
+        """
+        if hash(text) == self._last_hash:
+            return None
+
         if not text.strip():
-            self.update("")
-            return
-        
-        self.content = text
+            return "", {}
+
         try:
-            from rich.markdown import Markdown
-            
-            markdown = Markdown(text)
-            self.update(markdown)
+            if _LINK_DEF_RE.search(text):
+                return Markdown(text), {}
+
+            cache = self._para_cache
+            new_cache: dict = {}
+            tokens = []
+            for para in self._split_paragraphs(text):
+                parsed = cache.get(para)
+                if parsed is None:
+                    parsed = Markdown(para).parsed
+                new_cache[para] = parsed
+                tokens.extend(parsed)
+
+            markdown = Markdown("")
+            markdown.markup = text
+            markdown.parsed = tokens
+            return markdown, new_cache
         except Exception as e:
-            self.update(f"Preview Error: {str(e)}")
+            return f"Preview Error: {str(e)}", None
+
+    @staticmethod
+    def _split_paragraphs(text: str) -> List[str]:
+        """Split *text* at blank lines that end a top-level block.
+
+        Never splits inside a ``` / ~~~ fence, and keeps a block together
+        when the line after the blank continues it.
+        """
+        lines = text.split('\n')
+        n = len(lines)
+        paras: List[str] = []
+        current: List[str] = []
+        in_fence = False
+
+        for idx, line in enumerate(lines):
+            stripped = line.strip()
+
+            if stripped.startswith('```') or stripped.startswith('~~~'):
+                in_fence = not in_fence
+                current.append(line)
+                continue
+
+            if not stripped and not in_fence:
+                j = idx + 1
+                while j < n and not lines[j].strip():
+                    j += 1
+                if j < n and _BLOCK_CONTINUATION_RE.match(lines[j]):
+                    current.append(line)
+                    continue
+                if current:
+                    paras.append('\n'.join(current))
+                    current = []
+                continue
+
+            current.append(line)
+
+        if current:
+            paras.append('\n'.join(current))
+        return paras
+
+    def apply_render(self, text: str, renderable, new_cache: Optional[dict]) -> None:
+        """Commit a build from render_content and refresh the widget."""
+        if new_cache is None:
+            # Failed build: leave the hash unset so the next refresh retries.
+            self._last_hash = None
+        else:
+            self._last_hash = hash(text)
+            self._para_cache = new_cache
+        self.content = text if text.strip() else ""
+        self.update(renderable)
     
 
 
@@ -493,7 +619,9 @@ class Writ(App):
     def __init__(self):
         super().__init__()
         self.state = State()
-        self.format = Format()
+        self._preview_timer = None
+        self._line_index: Optional[Tuple[List[int], int]] = None
+        self._last_status: Optional[Tuple[str, bool, bool]] = None
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -526,23 +654,61 @@ class Writ(App):
     
     def on_text_area_changed(self, event: TextArea.Changed) -> None:
         self.state.modified = True
-        self._update_preview()
+        self._line_index = None
+        self._schedule_preview()
         self._update_status()
+
+    def _schedule_preview(self) -> None:
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+            self._preview_timer = None
+        if self.state.preview:
+            self._preview_timer = self.set_timer(0.15, self._update_preview)
     
     def on_resize(self, event) -> None:
         if self.state.preview:
             self.call_after_refresh(self._update_preview)
     
     def _update_preview(self) -> None:
+        if not self.state.preview:
+            return
         if hasattr(self, 'preview'):
-            try:
-                self.preview.update_content(self.editor.text)
-            except Exception as e:
-                self.preview.update(f"Preview Error: {str(e)}")
+            text = self.editor.text
+            self.run_worker(
+                partial(self._render_markdown, text),
+                thread=True,
+                exclusive=True,
+                group="preview",
+            )
+
+    def _render_markdown(self, text: str) -> None:
+        worker = get_current_worker()
+        result = self.preview.render_content(text)
+        if result is None or worker.is_cancelled:
+            return
+        self.call_from_thread(self._apply_preview, worker, text, result)
+
+    def _apply_preview(self, worker, text: str, result) -> None:
+        # Runs on the UI thread: a superseded render is guaranteed to be
+        # marked cancelled by now, so stale content never lands.
+        if worker.is_cancelled:
+            return
+        renderable, new_cache = result
+        self.preview.apply_render(text, renderable, new_cache)
     
     def _update_status(self) -> None:
-        if hasattr(self, 'status'):
-            self.status.update(self._status_text())
+        if not hasattr(self, 'status'):
+            return
+
+        current = (
+            self.state.file.name if self.state.file else "untitled",
+            self.state.modified,
+            self.state.preview,
+        )
+        if current == self._last_status:
+            return
+        self._last_status = current
+        self.status.update(self._status_text())
     
     def _get_initial_text(self) -> str:
         try:
@@ -560,38 +726,46 @@ class Writ(App):
         return f"{name}{mod} | Preview: {prev}"
     
     def _format_text(self, func, *args):
-        pos = self._get_cursor_position()
-        text, new_pos = func(self.editor.text, pos, *args)
-        self.editor.text = text
+        text = self.editor.text
+        pos = self._get_cursor_position(text)
+        new_text, new_pos = func(text, pos, *args)
+        self.editor.text = new_text
+        self._line_index = None
         self.call_after_refresh(self._set_cursor_position, new_pos)
-    
-    def _get_cursor_position(self) -> int:
+
+    def _get_line_index(self, text: Optional[str] = None) -> Tuple[List[int], int]:
+        if self._line_index is None:
+            if text is None:
+                text = self.editor.text
+            if np is not None and text.isascii():
+                # One byte per char, so byte offsets are str offsets.
+                buf = np.frombuffer(text.encode(), dtype=np.uint8)
+                offsets = [0] + (np.flatnonzero(buf == 0x0A) + 1).tolist()
+            else:
+                offsets = [0]
+                i = text.find('\n')
+                while i != -1:
+                    offsets.append(i + 1)
+                    i = text.find('\n', i + 1)
+            self._line_index = (offsets, len(text))
+        return self._line_index
+
+    def _get_cursor_position(self, text: Optional[str] = None) -> int:
         row, col = self.editor.cursor_location
-        lines = self.editor.text.split('\n')
-        pos = 0
-        
-        for i in range(row):
-            if i < len(lines):
-                pos += len(lines[i]) + 1
-        
-        if row < len(lines):
-            pos += min(col, len(lines[row]))
-        
-        return pos
-    
+        offsets, length = self._get_line_index(text)
+
+        if row >= len(offsets):
+            return length
+
+        line_end = offsets[row + 1] - 1 if row + 1 < len(offsets) else length
+        return offsets[row] + min(col, line_end - offsets[row])
+
     def _set_cursor_position(self, pos: int) -> None:
-        lines = self.editor.text.split('\n')
-        current_pos = 0
-        
-        for row, line in enumerate(lines):
-            if current_pos + len(line) >= pos:
-                col = pos - current_pos
-                self.editor.cursor_location = (row, col)
-                return
-            current_pos += len(line) + 1
-        
-        if lines:
-            self.editor.cursor_location = (len(lines) - 1, len(lines[-1]))
+        offsets, length = self._get_line_index()
+        row = bisect.bisect_right(offsets, pos) - 1
+        line_end = offsets[row + 1] - 1 if row + 1 < len(offsets) else length
+        col = min(pos - offsets[row], line_end - offsets[row])
+        self.editor.cursor_location = (row, col)
     
     def action_new(self) -> None:
         self.run_worker(self._new_worker)
@@ -633,7 +807,10 @@ class Writ(App):
                 if path.exists():
                     self.state.file = path
                     self.state.currentDir = path.parent
-                    self.editor.text = path.read_text(encoding='utf-8')
+                    loop = asyncio.get_running_loop()
+                    self.editor.text = await loop.run_in_executor(
+                        None, partial(path.read_text, encoding='utf-8')
+                    )
                     self.state.modified = False
                     self._update_status()
                     self._update_preview()
@@ -646,7 +823,10 @@ class Writ(App):
     async def _save_worker(self) -> None:
         if self.state.file:
             try:
-                self.state.file.write_text(self.editor.text, encoding='utf-8')
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, partial(self.state.file.write_text, self.editor.text, encoding='utf-8')
+                )
                 self.state.modified = False
                 self._update_status()
                 self.notify(f"Saved: {self.state.file.name}")
@@ -674,7 +854,10 @@ class Writ(App):
                         return
                 
                 filePath.parent.mkdir(parents=True, exist_ok=True)
-                filePath.write_text(self.editor.text, encoding='utf-8')
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    None, partial(filePath.write_text, self.editor.text, encoding='utf-8')
+                )
                 self.state.file = filePath
                 self.state.currentDir = filePath.parent
                 self.state.modified = False
@@ -708,40 +891,40 @@ class Writ(App):
         self._update_status()
     
     def action_bold(self) -> None:
-        self._format_text(self.format.bold)
+        self._format_text(bold)
     
     def action_italic(self) -> None:
-        self._format_text(self.format.italic)
+        self._format_text(italic)
     
     def action_inline_code(self) -> None:
-        self._format_text(self.format.inlineCode)
+        self._format_text(inlineCode)
     
     def action_link(self) -> None:
-        self._format_text(self.format.link)
+        self._format_text(link)
     
     def action_code_block(self) -> None:
-        self._format_text(self.format.codeBlock)
+        self._format_text(codeBlock)
     
     def action_list(self) -> None:
-        self._format_text(self.format.listItem)
+        self._format_text(listItem)
     
     def action_h1(self) -> None:
-        self._format_text(self.format.heading, 1)
+        self._format_text(heading, 1)
     
     def action_h2(self) -> None:
-        self._format_text(self.format.heading, 2)
+        self._format_text(heading, 2)
     
     def action_h3(self) -> None:
-        self._format_text(self.format.heading, 3)
+        self._format_text(heading, 3)
     
     def action_h4(self) -> None:
-        self._format_text(self.format.heading, 4)
+        self._format_text(heading, 4)
     
     def action_h5(self) -> None:
-        self._format_text(self.format.heading, 5)
+        self._format_text(heading, 5)
     
     def action_h6(self) -> None:
-        self._format_text(self.format.heading, 6)
+        self._format_text(heading, 6)
 
 
 def main():